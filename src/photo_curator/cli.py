@@ -4,36 +4,41 @@ from __future__ import annotations
 
 import argparse
 import logging
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
 from photo_curator import __version__
-from photo_curator.config import CuratorConfig, DEFAULT_BATCH_SIZE
+from photo_curator.config import (
+    CuratorConfig,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_EXIFTOOL_WORKERS,
+    DEFAULT_IO_WORKERS,
+)
 from photo_curator.logging_setup import setup_logging
 from photo_curator.matching.registry import available_strategies
 
 logger = logging.getLogger("photo_curator")
 
 
-def build_parser() -> argparse.ArgumentParser:
+def _build_run_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="photo-curator",
         description="Curate photo and video archives: organize, deduplicate, and discard.",
+        epilog=(
+            "Subcommands: run (the default), "
+            "undo MANIFEST (reverse a previous run using its JSON manifest)."
+        ),
     )
-    subparsers = parser.add_subparsers(dest="command")
-
-    # --- run subcommand (also the default when no subcommand given) ---
-    run_parser = subparsers.add_parser(
-        "run", help="Run the photo curation pipeline.",
-    )
-    _add_run_args(run_parser)
-    # Also add run args to the top-level parser for backward compat
     _add_run_args(parser)
+    return parser
 
-    # --- undo subcommand ---
-    undo_parser = subparsers.add_parser(
-        "undo", help="Reverse operations from a previous run using its JSON manifest.",
+
+def _build_undo_parser() -> argparse.ArgumentParser:
+    undo_parser = argparse.ArgumentParser(
+        prog="photo-curator undo",
+        description="Reverse operations from a previous run using its JSON manifest.",
     )
     undo_parser.add_argument(
         "manifest",
@@ -57,7 +62,7 @@ def build_parser() -> argparse.ArgumentParser:
         help="Directory for log files (default: same directory as manifest).",
     )
 
-    return parser
+    return undo_parser
 
 
 def _add_run_args(parser: argparse.ArgumentParser) -> None:
@@ -114,24 +119,73 @@ def _add_run_args(parser: argparse.ArgumentParser) -> None:
         default=DEFAULT_BATCH_SIZE,
         help=f"Number of files per exiftool batch call (default: {DEFAULT_BATCH_SIZE}).",
     )
+    parser.add_argument(
+        "--exiftool-workers",
+        type=int,
+        default=DEFAULT_EXIFTOOL_WORKERS,
+        help=(
+            "Number of parallel exiftool processes for metadata extraction "
+            f"(default: {DEFAULT_EXIFTOOL_WORKERS})."
+        ),
+    )
+    parser.add_argument(
+        "--trust-path-dates",
+        action="store_true",
+        help=(
+            "Take year/month from an existing YYYY/MM directory layout "
+            "instead of calling exiftool for those files."
+        ),
+    )
+    parser.add_argument(
+        "--compress-manifest",
+        action="store_true",
+        help="Write the JSON manifest gzip-compressed (.json.gz).",
+    )
+    parser.add_argument(
+        "--io-workers",
+        type=int,
+        default=DEFAULT_IO_WORKERS,
+        help=(
+            "Number of parallel copy/move workers "
+            f"(default: {DEFAULT_IO_WORKERS}; 1 disables parallel I/O)."
+        ),
+    )
+
+
+_exiftool_checked = False
 
 
 def _check_exiftool() -> None:
     """Verify exiftool is installed and on PATH."""
+    global _exiftool_checked
+    if _exiftool_checked:
+        return
+    if shutil.which("exiftool"):
+        # Fast path: a PATH lookup is a handful of stats, no process spawn.
+        _exiftool_checked = True
+        return
     try:
+        # Only the return code matters; DEVNULL lets the kernel discard
+        # the output instead of allocating pipes we never read.
         subprocess.run(
             ["exiftool", "-ver"],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
         )
+        _exiftool_checked = True
     except (subprocess.CalledProcessError, FileNotFoundError):
         print("Error: exiftool is not installed or not in PATH.", file=sys.stderr)
         print("Install it with: sudo apt install libimage-exiftool-perl", file=sys.stderr)
         raise SystemExit(1)
 
 
-def _validate_run_args(args: argparse.Namespace) -> None:
-    """Validate CLI arguments for the run command."""
+def _validate_run_args(args: argparse.Namespace) -> tuple[Path, Path, Path]:
+    """Validate run-command arguments and return the three directories.
+
+    Paths are resolved exactly once here; callers must use the returned
+    (source, destination, discard) instead of re-resolving args.
+    """
     if not args.source:
         raise SystemExit("Error: --source is required")
     if not args.destination:
@@ -146,10 +200,14 @@ def _validate_run_args(args: argparse.Namespace) -> None:
         args.destination.mkdir(parents=True, exist_ok=True)
         args.discard.mkdir(parents=True, exist_ok=True)
 
-    if args.source.resolve() == args.destination.resolve():
+    source = args.source.resolve()
+    destination = args.destination.resolve()
+    discard = args.discard.resolve()
+    if source == destination:
         logger.info("Recursive mode: source and destination are the same directory.")
 
     _check_exiftool()
+    return source, destination, discard
 
 
 def _cmd_run(args: argparse.Namespace) -> None:
@@ -157,18 +215,22 @@ def _cmd_run(args: argparse.Namespace) -> None:
     log_dir = (args.log_dir or Path(".")).resolve()
     run_id = setup_logging(verbose=args.verbose, log_dir=log_dir)
 
-    _validate_run_args(args)
+    source, destination, discard = _validate_run_args(args)
 
     config = CuratorConfig(
-        source=args.source.resolve(),
-        destination=args.destination.resolve(),
-        discard=args.discard.resolve(),
+        source=source,
+        destination=destination,
+        discard=discard,
         mode=args.mode,
         match_strategy=args.match_strategy,
         dry_run=args.dry_run,
         exiftool_batch_size=args.exiftool_batch_size,
         verbose=args.verbose,
         log_dir=log_dir,
+        exiftool_workers=args.exiftool_workers,
+        io_workers=args.io_workers,
+        trust_path_dates=args.trust_path_dates,
+        compress_manifest=args.compress_manifest,
     )
 
     logger.info("=" * 60)
@@ -228,11 +290,15 @@ def _cmd_undo(args: argparse.Namespace) -> None:
 
 
 def main() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
-
-    if args.command == "undo":
+    # Sniff the subcommand before building a parser so each invocation
+    # only constructs the parser branch it actually needs.
+    argv = sys.argv[1:]
+    if argv and argv[0] == "undo":
+        args = _build_undo_parser().parse_args(argv[1:])
         _cmd_undo(args)
-    else:
-        # Default to run (handles both explicit "run" and no subcommand)
-        _cmd_run(args)
+        return
+
+    if argv and argv[0] == "run":
+        argv = argv[1:]
+    args = _build_run_parser().parse_args(argv)
+    _cmd_run(args)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import FrozenSet
@@ -33,15 +34,45 @@ SKIP_DIRNAMES: FrozenSet[str] = frozenset({
     ".picasaoriginals",
 })
 
+# First characters of the skip names above. Almost no real filename starts
+# with one of these, so scanners can reject most names with a single char
+# test before paying for the full lowercase + set lookup.
+SKIP_FILENAME_FIRST_CHARS: FrozenSet[str] = frozenset(
+    n[0] for n in SKIP_FILENAMES
+)
+SKIP_DIRNAME_FIRST_CHARS: FrozenSet[str] = frozenset(
+    n[0] for n in SKIP_DIRNAMES
+)
+
 EXIF_DATE_FIELDS: list[str] = [
     "DateTimeOriginal",
     "CreateDate",
     "MediaCreateDate",
 ]
 
-EXIFTOOL_TIMEOUT: int = 300  # seconds
 DEFAULT_BATCH_SIZE: int = 500
 
+# Ceiling per exiftool batch; a hang on one pathological file must not
+# block the run (the worker is killed and respawned on expiry).
+EXIFTOOL_TIMEOUT: int = 300
+
+# Hashing is I/O-bound and hashlib releases the GIL, so oversubscribe cores.
+DEFAULT_HASH_WORKERS: int = min(32, (os.cpu_count() or 1) * 2)
+
+# Each worker owns a persistent exiftool (Perl) process, so stay modest.
+DEFAULT_EXIFTOOL_WORKERS: int = min(4, os.cpu_count() or 1)
+
+# Copy/move workers; transfers are I/O-bound so a few threads overlap well.
+DEFAULT_IO_WORKERS: int = min(8, (os.cpu_count() or 1) * 2)
+
+
+def cache_dir() -> Path:
+    """Per-user cache directory, overridable via PHOTO_CURATOR_CACHE_DIR."""
+    override = os.environ.get("PHOTO_CURATOR_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "photo-curator"
+
 
 @dataclass(frozen=True)
 class CuratorConfig:
@@ -56,3 +87,7 @@ class CuratorConfig:
     exiftool_batch_size: int
     verbose: bool
     log_dir: Path
+    exiftool_workers: int = DEFAULT_EXIFTOOL_WORKERS
+    io_workers: int = DEFAULT_IO_WORKERS
+    trust_path_dates: bool = False
+    compress_manifest: bool = False
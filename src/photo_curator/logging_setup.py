@@ -1,21 +1,48 @@
 """Logging configuration for photo-curator."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
 
+# Listener draining log records to the file handler on a background thread.
+_listener: logging.handlers.QueueListener | None = None
+_atexit_registered = False
+
+
+def _stop_listener() -> None:
+    """Flush and stop the background log listener, if one is running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging(verbose: bool = False, log_dir: Path = Path(".")) -> str:
     """Configure the photo_curator logger with console + timestamped file handler.
 
+    File I/O happens on a QueueListener thread so hot loops never block on
+    disk writes; the console handler stays synchronous so progress output is
+    immediate.
+
     Returns the run_id string (e.g. 'photo-curator_20260216_143022') so the
     manifest writer can use the same timestamp.
     """
+    global _listener, _atexit_registered
     run_id = f"photo-curator_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
     root = logging.getLogger("photo_curator")
     root.setLevel(logging.DEBUG)
+    # Reconfiguring (tests, undo after a run) must not stack handlers:
+    # duplicated handlers double every record's formatting and I/O cost.
+    _stop_listener()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.propagate = False
 
     console = logging.StreamHandler(sys.stdout)
     console.setLevel(logging.DEBUG if verbose else logging.INFO)
@@ -32,6 +59,15 @@ def setup_logging(verbose: bool = False, log_dir: Path = Path(".")) -> str:
     fh.setFormatter(logging.Formatter(
         "%(asctime)s [%(levelname)-7s] %(name)s: %(message)s",
     ))
-    root.addHandler(fh)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, fh, respect_handler_level=True
+    )
+    _listener.start()
+    if not _atexit_registered:
+        atexit.register(_stop_listener)
+        _atexit_registered = True
 
     return run_id
@@ -2,33 +2,78 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import logging
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 
 from photo_curator.config import CuratorConfig
 from photo_curator.models import OperationRecord, PipelineResult
 
+try:  # optional accelerator, installed via the "fast" extra
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps_line(obj: dict) -> str:
+    """Serialize one spool line, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
 class ManifestWriter:
-    """Collects file operations during a run and writes a JSON manifest."""
+    """Streams file operations to disk and writes a JSON manifest.
+
+    Operations are appended to a JSONL spool file as they happen, so memory
+    stays flat no matter how many files a run touches and a crash leaves the
+    spool behind as a recovery record. Spool writes happen on a background
+    thread fed by a queue, so record() never blocks a transfer on log-disk
+    I/O and is safe to call from the mover's worker threads without a lock.
+    finalize() stitches the spool into the final manifest and removes it.
+    """
 
     def __init__(self, run_id: str, config: CuratorConfig, log_dir: Path) -> None:
         self.run_id = run_id
         self.config = config
         self.log_dir = log_dir
-        self.operations: list[OperationRecord] = []
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._spool_path = log_dir / f"{run_id}.operations.jsonl"
+        self._spool = open(self._spool_path, "w", encoding="utf-8")
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._drain, name="manifest-writer", daemon=True
+        )
+        self._writer.start()
 
     def record(self, operation: OperationRecord) -> None:
-        """Append a completed file operation."""
-        self.operations.append(operation)
+        """Queue a completed file operation for the spool writer thread."""
+        # The record goes on the queue as-is; dict conversion happens on
+        # the writer thread so the calling transfer thread pays only for
+        # the enqueue.
+        self._queue.put(operation)
+
+    def _drain(self) -> None:
+        """Writer thread: serialize queued operations into the spool."""
+        while True:
+            item = self._queue.get()
+            if item is None:  # sentinel from finalize()
+                break
+            self._spool.write(_dumps_line(_operation_to_dict(item)) + "\n")
+        self._spool.close()
 
     def finalize(self, result: PipelineResult) -> Path:
         """Write the JSON manifest file and return its path."""
-        manifest = {
+        self._queue.put(None)
+        self._writer.join()
+
+        head = {
             "schema_version": "1.0",
             "run_id": self.run_id,
             "timestamp": datetime.now().isoformat(timespec="seconds"),
@@ -40,26 +85,42 @@ class ManifestWriter:
                 "match_strategy": self.config.match_strategy,
                 "dry_run": self.config.dry_run,
             },
-            "operations": [
-                _operation_to_dict(op) for op in self.operations
-            ],
-            "summary": {
-                "files_scanned": result.files_scanned,
-                "files_stored": result.files_stored,
-                "files_discarded": result.files_discarded,
-                "files_skipped": result.files_skipped,
-                "files_no_date": result.files_no_date,
-                "errors": result.errors,
-            },
+        }
+        summary = {
+            "files_scanned": result.files_scanned,
+            "files_stored": result.files_stored,
+            "files_discarded": result.files_discarded,
+            "files_skipped": result.files_skipped,
+            "files_no_date": result.files_no_date,
+            "errors": result.errors,
         }
 
-        self.log_dir.mkdir(parents=True, exist_ok=True)
-        manifest_path = self.log_dir / f"{self.run_id}.json"
-        manifest_path.write_text(
-            json.dumps(manifest, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
+        if self.config.compress_manifest:
+            # Level 1 keeps compression essentially free; JSON this
+            # repetitive still shrinks ~10x.
+            manifest_path = self.log_dir / f"{self.run_id}.json.gz"
+            sink = gzip.open(
+                manifest_path, "wt", encoding="utf-8", compresslevel=1
+            )
+        else:
+            manifest_path = self.log_dir / f"{self.run_id}.json"
+            sink = open(manifest_path, "w", encoding="utf-8")
+        with sink as out:
+            head_json = json.dumps(head, indent=2, ensure_ascii=False)
+            out.write(head_json[:-2])  # drop the closing "\n}"
+            out.write(',\n  "operations": [')
+            first = True
+            with open(self._spool_path, encoding="utf-8") as spool:
+                for line in spool:
+                    out.write("\n    " if first else ",\n    ")
+                    out.write(line.rstrip("\n"))
+                    first = False
+            out.write("],\n" if first else "\n  ],\n")
+            summary_json = json.dumps(summary, indent=2, ensure_ascii=False)
+            out.write('  "summary": ' + summary_json.replace("\n", "\n  "))
+            out.write("\n}\n")
 
+        self._spool_path.unlink(missing_ok=True)
         logger.info(f"Manifest: {manifest_path}")
         return manifest_path
 
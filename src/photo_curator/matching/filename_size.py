@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import sys
 from pathlib import Path
 
 from photo_curator.matching.base import MatchStrategy
@@ -22,39 +22,37 @@ class FilenameSizeStrategy(MatchStrategy):
         return "filename-size"
 
     def build_index(self, destination: Path) -> FilenameSizeIndex:
-        """Index destination by (filename_lower, size)."""
-        index: dict[tuple[str, int], list[Path]] = defaultdict(list)
-        for file_path, size in walk_destination(destination):
-            key = (file_path.name.lower(), size)
-            index[key].append(file_path)
-        return dict(index)
+        """Index destination by (casefolded filename, size)."""
+        index: dict[tuple[str, int], list[Path]] = {}
+        for file_path, size, _ in walk_destination(destination):
+            key = (sys.intern(file_path.name.casefold()), size)
+            index.setdefault(key, []).append(file_path)
+        return index
 
     def match_all(
         self,
         source_files: list[FileRecord],
         dest_index: FilenameSizeIndex,
     ) -> list[MatchResult]:
-        results: list[MatchResult] = []
-
-        for record in source_files:
-            key = (record.path.name.lower(), record.size)
-            matches = dest_index.get(key, [])
-
+        # Group source files by key first: each key costs one index lookup
+        # total instead of one per file, and source-to-source duplicates fall
+        # out of the grouping (the first file in a group is the keeper).
+        results: list[MatchResult] = [None] * len(source_files)  # type: ignore[list-item]
+        groups: dict[tuple[str, int], list[int]] = {}
+        for i, record in enumerate(source_files):
+            groups.setdefault((record.name_folded, record.size), []).append(i)
+
+        for key, indices in groups.items():
+            matches = dest_index.get(key)
             if matches:
-                results.append(MatchResult(
-                    source=record,
-                    matched_destination=matches[0],
-                    is_duplicate=True,
-                ))
-            else:
-                results.append(MatchResult(
-                    source=record,
-                    matched_destination=None,
-                    is_duplicate=False,
-                ))
-                # Track this source file so later source duplicates are caught
-                if key not in dest_index:
-                    dest_index[key] = []
-                dest_index[key].append(record.path)
+                for i in indices:
+                    results[i] = MatchResult(source_files[i], matches[0], True)
+                continue
+            primary = source_files[indices[0]]
+            results[indices[0]] = MatchResult(primary, None, False)
+            # Track the keeper so later source duplicates are caught
+            dest_index.setdefault(key, []).append(primary.path)
+            for i in indices[1:]:
+                results[i] = MatchResult(source_files[i], primary.path, True)
 
         return results
@@ -0,0 +1,79 @@
+"""Persistent SHA256 cache so unchanged files are never hashed twice.
+
+Digests are keyed by (path, size, mtime_ns); any change to the file
+invalidates its entry naturally, so there is no expiry logic.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+from photo_curator.config import cache_dir
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+)
+"""
+
+
+class HashCache:
+    """SQLite-backed cache of file content hashes.
+
+    A cached digest is reused only when path, size, and mtime all match,
+    so edited or replaced files are always re-hashed. Writes are buffered
+    in memory and flushed in a single transaction.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(_SCHEMA)
+        self._pending: list[tuple[str, int, int, str]] = []
+
+    @classmethod
+    def default(cls) -> Optional[HashCache]:
+        """Open the cache in the user cache directory; None if unavailable."""
+        try:
+            return cls(cache_dir() / "hashes.sqlite")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Hash cache unavailable: {e}")
+            return None
+
+    def get(self, path: Path, size: int, mtime_ns: int) -> Optional[str]:
+        """Return the cached digest for an unchanged file, else None."""
+        row = self._conn.execute(
+            "SELECT sha256 FROM hashes"
+            " WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (str(path), size, mtime_ns),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, path: Path, size: int, mtime_ns: int, sha256: str) -> None:
+        """Queue a digest for the next flush()."""
+        self._pending.append((str(path), size, mtime_ns, sha256))
+
+    def flush(self) -> None:
+        """Write all queued digests in one transaction."""
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?)",
+                self._pending,
+            )
+        self._pending.clear()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
@@ -2,32 +2,39 @@
 
 from __future__ import annotations
 
-from photo_curator.matching.base import MatchStrategy
-from photo_curator.matching.content_hash import ContentHashStrategy
-from photo_curator.matching.filename_size import FilenameSizeStrategy
-
-_STRATEGIES: dict[str, MatchStrategy] = {}
+import importlib
 
+from photo_curator.matching.base import MatchStrategy
 
-def _register(strategy: MatchStrategy) -> None:
-    _STRATEGIES[strategy.name] = strategy
+# Strategy name -> (module, class name). Modules are imported on first
+# lookup so the CLI cold path (--help, argument errors) never pays for
+# strategy imports such as hashlib or the scanner.
+_STRATEGY_MODULES: dict[str, tuple[str, str]] = {
+    "filename-size": ("photo_curator.matching.filename_size", "FilenameSizeStrategy"),
+    "content-hash": ("photo_curator.matching.content_hash", "ContentHashStrategy"),
+}
 
+# Computed once at import; the registry is fixed after module load.
+_AVAILABLE: tuple[str, ...] = tuple(sorted(_STRATEGY_MODULES))
 
-# Register built-in strategies
-_register(FilenameSizeStrategy())
-_register(ContentHashStrategy())
+_instances: dict[str, MatchStrategy] = {}
 
 
 def get_strategy(name: str) -> MatchStrategy:
-    """Look up a strategy by its CLI name."""
-    if name not in _STRATEGIES:
-        available = ", ".join(sorted(_STRATEGIES.keys()))
+    """Look up a strategy by its CLI name, importing its module on first use."""
+    if name not in _STRATEGY_MODULES:
+        available = ", ".join(_AVAILABLE)
         raise ValueError(
             f"Unknown match strategy '{name}'. Available: {available}"
         )
-    return _STRATEGIES[name]
+    instance = _instances.get(name)
+    if instance is None:
+        module_name, class_name = _STRATEGY_MODULES[name]
+        module = importlib.import_module(module_name)
+        instance = _instances.setdefault(name, getattr(module, class_name)())
+    return instance
 
 
-def available_strategies() -> list[str]:
+def available_strategies() -> tuple[str, ...]:
     """Return names of all registered strategies."""
-    return sorted(_STRATEGIES.keys())
+    return _AVAILABLE
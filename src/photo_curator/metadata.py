@@ -4,35 +4,255 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+import sqlite3
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-from photo_curator.config import EXIF_DATE_FIELDS, EXIFTOOL_TIMEOUT
+from photo_curator.config import (
+    DEFAULT_EXIFTOOL_WORKERS,
+    EXIF_DATE_FIELDS,
+    EXIFTOOL_TIMEOUT,
+    cache_dir,
+)
 from photo_curator.models import FileRecord
 
 logger = logging.getLogger(__name__)
 
+_DATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS exif_dates (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    date TEXT NOT NULL
+)
+"""
+
+
+class ExifDateCache:
+    """SQLite-backed cache of extracted EXIF date strings.
+
+    Keyed by (path, size, mtime_ns) like the hash cache, so a touched file
+    is re-queried. Files known to have no usable date are stored as an
+    empty string; they are the expensive case (exiftool scans the whole
+    file for a date) and must not be re-queried every run either.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(_DATE_SCHEMA)
+        self._pending: list[tuple[str, int, int, str]] = []
+
+    @classmethod
+    def default(cls) -> Optional[ExifDateCache]:
+        """Open the cache in the user cache directory; None if unavailable."""
+        try:
+            return cls(cache_dir() / "exif.sqlite")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"EXIF date cache unavailable: {e}")
+            return None
+
+    def get(self, path: Path, size: int, mtime_ns: int) -> Optional[str]:
+        """Return the cached date ("" = known dateless), or None on miss."""
+        row = self._conn.execute(
+            "SELECT date FROM exif_dates"
+            " WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (str(path), size, mtime_ns),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, path: Path, size: int, mtime_ns: int, date: str) -> None:
+        """Queue a date string for the next flush()."""
+        self._pending.append((str(path), size, mtime_ns, date))
+
+    def flush(self) -> None:
+        """Write all queued dates in one transaction."""
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO exif_dates VALUES (?, ?, ?, ?)",
+                self._pending,
+            )
+        self._pending.clear()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+
+# Year and month at the start of an exiftool date string; the lookahead
+# accepts 'YYYY:MM' alone or followed by the rest of the timestamp.
+_DATE_RE = re.compile(r"^(?P<year>\d{4}):(?P<month>\d{1,2})(?=[:\s]|$)")
+
 
 def parse_date(date_str: Optional[str]) -> Optional[tuple[str, str]]:
     """Parse 'YYYY:MM:DD HH:MM:SS' into (YYYY, MM) or None."""
     if not date_str:
         return None
-    try:
-        parts = date_str.split()[0].split(":")
-        if len(parts) >= 2:
-            year = parts[0]
-            month = parts[1].zfill(2)
-            if 1900 <= int(year) <= 2100 and 1 <= int(month) <= 12:
-                return (year, month)
-    except (ValueError, IndexError):
-        pass
+    m = _DATE_RE.match(date_str)
+    if not m:
+        return None
+    year, month = m.group("year", "month")
+    if 1900 <= int(year) <= 2100 and 1 <= int(month) <= 12:
+        return (year, month.zfill(2))
     return None
 
 
+def _infer_date_from_path(path: Path) -> Optional[tuple[str, str]]:
+    """Infer (YYYY, MM) from a `.../YYYY/MM/file` path layout, or None.
+
+    Recognizes the same layout the mover writes, validated with the same
+    ranges as parse_date, so re-importing an already-organized tree can
+    skip exiftool entirely.
+    """
+    parts = path.parts
+    if len(parts) < 3:
+        return None
+    year, month = parts[-3], parts[-2]
+    if len(year) != 4 or not year.isdigit():
+        return None
+    if not month.isdigit() or len(month) > 2:
+        return None
+    if 1900 <= int(year) <= 2100 and 1 <= int(month) <= 12:
+        return (year, month.zfill(2))
+    return None
+
+
+class ExifToolProcess:
+    """A single persistent ``exiftool -stay_open`` worker.
+
+    Each exiftool invocation pays a Perl interpreter startup; -stay_open
+    keeps one process alive and feeds it argument batches over stdin. A
+    ``{readyN}`` sentinel on stdout marks the end of each response.
+    """
+
+    def __init__(self) -> None:
+        self._proc = subprocess.Popen(
+            ["exiftool", "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        self._seq = 0
+
+    def execute(self, args: list[str], timeout: float = EXIFTOOL_TIMEOUT) -> str:
+        """Run one exiftool command and return its stdout.
+
+        A watchdog kills the worker if it has not answered within
+        ``timeout`` seconds, so a hang on one pathological file surfaces
+        as a RuntimeError the caller can recover from (respawning the
+        worker) instead of blocking the thread forever.
+        """
+        self._seq += 1
+        tag = self._seq
+        self._proc.stdin.write("\n".join(args) + f"\n-execute{tag}\n")
+        self._proc.stdin.flush()
+
+        timed_out = threading.Event()
+
+        def _expire() -> None:
+            timed_out.set()
+            self._proc.kill()
+
+        watchdog = threading.Timer(timeout, _expire)
+        watchdog.start()
+        sentinel = f"{{ready{tag}}}"
+        lines: list[str] = []
+        try:
+            while True:
+                line = self._proc.stdout.readline()
+                if not line:
+                    if timed_out.is_set():
+                        raise RuntimeError(
+                            f"exiftool batch timed out after {timeout:.0f}s"
+                        )
+                    raise RuntimeError("exiftool process exited unexpectedly")
+                if line.strip() == sentinel:
+                    return "".join(lines)
+                lines.append(line)
+        finally:
+            watchdog.cancel()
+
+    def close(self) -> None:
+        """Ask the worker to exit, killing it if it does not comply."""
+        if self._proc.poll() is not None:
+            return
+        try:
+            self._proc.stdin.write("-stay_open\nFalse\n")
+            self._proc.stdin.flush()
+            self._proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+            self._proc.wait()
+
+
 class MetadataExtractor:
-    def __init__(self, batch_size: int = 500) -> None:
+    def __init__(
+        self,
+        batch_size: int = 500,
+        cache: Optional[ExifDateCache] = None,
+        workers: int = DEFAULT_EXIFTOOL_WORKERS,
+        trust_path_dates: bool = False,
+    ) -> None:
         self.batch_size = batch_size
+        self.workers = workers
+        self.trust_path_dates = trust_path_dates
+        # Each thread gets its own exiftool worker; all spawned workers are
+        # tracked so close() can reap them from the main thread.
+        self._local = threading.local()
+        self._procs: list[ExifToolProcess] = []
+        self._procs_lock = threading.Lock()
+        self._cache = cache
+        self._cache_opened = cache is not None
+
+    def _get_cache(self) -> Optional[ExifDateCache]:
+        """Open the default date cache on first use."""
+        if not self._cache_opened:
+            self._cache = ExifDateCache.default()
+            self._cache_opened = True
+        return self._cache
+
+    def _get_process(self) -> ExifToolProcess:
+        """Return this thread's exiftool worker, starting it on first use."""
+        proc = getattr(self._local, "process", None)
+        if proc is None:
+            proc = ExifToolProcess()
+            self._local.process = proc
+            with self._procs_lock:
+                self._procs.append(proc)
+        return proc
+
+    def _reset_process(self) -> None:
+        """Drop this thread's worker after an error so it is respawned."""
+        proc = getattr(self._local, "process", None)
+        if proc is not None:
+            self._local.process = None
+            with self._procs_lock:
+                if proc in self._procs:
+                    self._procs.remove(proc)
+            proc.close()
+
+    def close(self) -> None:
+        """Shut down every spawned exiftool worker."""
+        with self._procs_lock:
+            procs, self._procs = self._procs, []
+        for proc in procs:
+            proc.close()
+        self._local = threading.local()
+
+    def __enter__(self) -> MetadataExtractor:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def enrich(
         self,
@@ -43,69 +263,131 @@ class MetadataExtractor:
         if not media_files:
             return []
 
-        paths = [f.path for f in media_files]
-        date_map = self._batch_extract_dates(paths)
+        # Files already sitting under a YYYY/MM directory carry their date
+        # in the path; the filesystem layout is the cheapest cache there is.
+        inferred: dict[str, tuple[str, str]] = {}
+        candidates = media_files
+        if self.trust_path_dates:
+            candidates = []
+            for record in media_files:
+                date_tuple = _infer_date_from_path(record.path)
+                if date_tuple:
+                    inferred[str(record.path)] = date_tuple
+                else:
+                    candidates.append(record)
+            if inferred:
+                logger.info(
+                    f"  Path dates: {len(inferred)}/{len(media_files)} inferred"
+                )
+
+        cache = self._get_cache()
+        cached_dates: dict[str, Optional[str]] = {}
+        to_query = candidates
+        if cache is not None:
+            to_query = []
+            for record in candidates:
+                hit = cache.get(record.path, record.size, record.mtime_ns)
+                if hit is None:
+                    to_query.append(record)
+                else:
+                    cached_dates[str(record.path)] = hit or None
+            if cached_dates:
+                logger.info(
+                    f"  Date cache: {len(cached_dates)}/{len(media_files)} hits"
+                )
+
+        date_map = (
+            self._batch_extract_dates([r.path for r in to_query])
+            if to_query else {}
+        )
+        if cache is not None:
+            for record in to_query:
+                key = str(record.path)
+                # Only cache files exiftool actually answered for; a failed
+                # batch must not persist as "known dateless".
+                if key in date_map:
+                    cache.put(
+                        record.path, record.size, record.mtime_ns,
+                        date_map[key] or "",
+                    )
+            cache.flush()
 
-        enriched: list[FileRecord] = []
+        # The pipeline is the sole owner of these records at this point, so
+        # fill in year/month in place instead of rebuilding every FileRecord;
+        # the rebuild was the largest allocation burst in the run.
         for record in media_files:
-            date_str = date_map.get(str(record.path))
-            date_tuple = parse_date(date_str)
-            enriched.append(FileRecord(
-                path=record.path,
-                category=record.category,
-                size=record.size,
-                extension=record.extension,
-                year=date_tuple[0] if date_tuple else None,
-                month=date_tuple[1] if date_tuple else None,
-            ))
-
-        return enriched
+            key = str(record.path)
+            date_tuple = inferred.get(key)
+            if date_tuple is None:
+                date_str = (
+                    cached_dates[key] if key in cached_dates
+                    else date_map.get(key)
+                )
+                date_tuple = parse_date(date_str)
+            if date_tuple:
+                object.__setattr__(record, "year", date_tuple[0])
+                object.__setattr__(record, "month", date_tuple[1])
+
+        return media_files
 
     def _batch_extract_dates(
         self, file_paths: list[Path],
     ) -> dict[str, Optional[str]]:
         """Call exiftool in batches, return {path_str: date_str_or_None}."""
+        batches = [
+            file_paths[i : i + self.batch_size]
+            for i in range(0, len(file_paths), self.batch_size)
+        ]
         result: dict[str, Optional[str]] = {}
 
-        for i in range(0, len(file_paths), self.batch_size):
-            batch = file_paths[i : i + self.batch_size]
-            try:
-                cmd = [
-                    "exiftool",
-                    "-json",
-                    *[f"-{field}" for field in EXIF_DATE_FIELDS],
-                    "-d", "%Y:%m:%d %H:%M:%S",
-                    *[str(p) for p in batch],
-                ]
-                proc = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=EXIFTOOL_TIMEOUT,
-                )
-                if proc.returncode != 0 and not proc.stdout:
-                    logger.warning(
-                        f"exiftool batch {i // self.batch_size} failed: "
-                        f"{proc.stderr[:200]}"
-                    )
-                    continue
-
-                data = json.loads(proc.stdout)
-                for item in data:
-                    file_path = item.get("SourceFile", "")
-                    date_str = None
-                    for field in EXIF_DATE_FIELDS:
-                        val = item.get(field)
-                        if val and val != "0000:00:00 00:00:00":
-                            date_str = val
-                            break
-                    result[file_path] = date_str
-
-            except subprocess.TimeoutExpired:
-                logger.warning(f"exiftool batch {i // self.batch_size} timed out")
-            except json.JSONDecodeError as e:
-                logger.warning(f"exiftool JSON parse error: {e}")
-            except Exception as e:
-                logger.warning(f"exiftool batch error: {e}")
+        if self.workers > 1 and len(batches) > 1:
+            workers = min(self.workers, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for partial in pool.map(
+                    self._extract_batch, batches, range(len(batches))
+                ):
+                    result.update(partial)
+        else:
+            for batch_no, batch in enumerate(batches):
+                result.update(self._extract_batch(batch, batch_no))
+
+        return result
+
+    def _extract_batch(
+        self, batch: list[Path], batch_no: int,
+    ) -> dict[str, Optional[str]]:
+        """Run one exiftool batch on this thread's worker process."""
+        result: dict[str, Optional[str]] = {}
+        try:
+            args = [
+                "-json",
+                *[f"-{field}" for field in EXIF_DATE_FIELDS],
+                "-d", "%Y:%m:%d %H:%M:%S",
+                *[str(p) for p in batch],
+            ]
+            output = self._get_process().execute(args)
+            if not output.strip():
+                logger.warning(f"exiftool batch {batch_no} returned no output")
+                return result
+
+            data = json.loads(output)
+            for item in data:
+                file_path = item.get("SourceFile", "")
+                date_str = None
+                for field in EXIF_DATE_FIELDS:
+                    val = item.get(field)
+                    if val and val != "0000:00:00 00:00:00":
+                        date_str = val
+                        break
+                result[file_path] = date_str
+
+        except (RuntimeError, OSError) as e:
+            logger.warning(f"exiftool batch error: {e}")
+            # This thread's worker is in an unknown state; respawn it.
+            self._reset_process()
+        except json.JSONDecodeError as e:
+            logger.warning(f"exiftool JSON parse error: {e}")
+        except Exception as e:
+            logger.warning(f"exiftool batch error: {e}")
 
         return result
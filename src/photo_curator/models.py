@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import enum
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -25,9 +26,13 @@ class Action(enum.Enum):
     NO_DATE = "no_date"  # Store in destination/NoDate/
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileRecord:
-    """A discovered file with its metadata."""
+    """A discovered file with its metadata.
+
+    Frozen by convention; the metadata phase fills in year/month on the
+    records it owns via object.__setattr__ rather than rebuilding them.
+    """
 
     path: Path
     category: FileCategory
@@ -36,11 +41,27 @@ class FileRecord:
     year: Optional[str] = None  # YYYY from EXIF
     month: Optional[str] = None  # MM from EXIF
     parent_media: Optional[Path] = None  # For sidecars: their media file
+    mtime_ns: int = 0  # modification time from the scan stat
+    name_folded: str = ""  # casefolded filename, interned; set in __post_init__
+
+    def __post_init__(self) -> None:
+        # Interning dedupes the many repeated camera filenames (IMG_0001.jpg
+        # across folders) and makes index-key comparisons pointer-fast.
+        # casefold() rather than lower(): identical for ASCII, but correct
+        # for filenames with ß, dotted İ, and friends.
+        if not self.name_folded:
+            object.__setattr__(
+                self, "name_folded", sys.intern(self.path.name.casefold())
+            )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchResult:
-    """Result of comparing a source file against the destination archive."""
+    """Result of comparing a source file against the destination archive.
+
+    One instance exists per scanned file, so it is slotted to keep the
+    per-instance footprint down on large archives.
+    """
 
     source: FileRecord
     matched_destination: Optional[Path]  # None = new file
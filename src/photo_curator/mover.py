@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
@@ -15,20 +18,94 @@ from photo_curator.models import Action, FileAction, OperationRecord, PipelineRe
 logger = logging.getLogger(__name__)
 
 
-def resolve_duplicate_name(target: Path) -> Path:
-    """If target exists, append _001, _002, etc. until a free name is found."""
-    if not target.exists():
+# os.copy_file_range copies inside the kernel (server-side copy, or a
+# reflink on filesystems that support it) with no userspace data pass.
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+
+def _fast_copy(src: Path, dest: Path) -> bool:
+    """Copy src to dest via copy_file_range; False if unusable.
+
+    Returns False without cleaning up on any failure — the caller falls
+    back to shutil.copy2, which truncates and rewrites dest in full.
+    """
+    if not _HAS_COPY_FILE_RANGE:
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                n = os.copy_file_range(
+                    fsrc.fileno(), fdst.fileno(), remaining
+                )
+                if n == 0:
+                    return False  # unexpected EOF; let copy2 sort it out
+                remaining -= n
+        shutil.copystat(src, dest)
+        return True
+    except OSError:
+        # EXDEV (pre-5.3 kernels), unsupported filesystem, etc.
+        return False
+
+
+def _list_dir_names(directory: Path) -> set[str]:
+    """Names currently present in a directory (empty if it does not exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {e.name for e in entries}
+    except OSError:
+        return set()
+
+
+def resolve_duplicate_name(target: Path, existing: Optional[set[str]] = None) -> Path:
+    """If target exists, append _001, _002, etc. until a free name is found.
+
+    A colliding name probes against one directory listing rather than one
+    exists() stat per candidate. Callers resolving many names in the same
+    directory should pass (and maintain) their own ``existing`` set; when
+    omitted, the directory is listed here.
+    """
+    if existing is None:
+        existing = _list_dir_names(target.parent)
+    if target.name not in existing:
         return target
     stem = target.stem
     suffix = target.suffix
-    parent = target.parent
     for counter in range(1, 10000):
-        candidate = parent / f"{stem}_{counter:03d}{suffix}"
-        if not candidate.exists():
-            return candidate
+        name = f"{stem}_{counter:03d}{suffix}"
+        if name not in existing:
+            return target.parent / name
     raise RuntimeError(f"Too many duplicates for {target}")
 
 
+# Below this many actions, sorting buys nothing worth measuring.
+_SORT_THRESHOLD = 32
+
+
+def _dest_sort_key(action: FileAction) -> tuple[str, str]:
+    """Order actions by destination directory, then filename."""
+    dest = action.destination_path
+    if dest is None:  # SKIP actions have no destination
+        return ("", "")
+    return (dest.parent.as_posix(), dest.name)
+
+
+def _new_tallies() -> dict[str, int]:
+    """Fresh per-run counters, keyed by _execute_one outcome."""
+    return {
+        "stored": 0, "discarded": 0, "skipped": 0, "no_date": 0, "errors": 0,
+    }
+
+
+def _apply_tallies(result: PipelineResult, tallies: dict[str, int]) -> None:
+    """Fold a run's local tallies into the shared result in one pass."""
+    result.files_stored += tallies["stored"]
+    result.files_discarded += tallies["discarded"]
+    result.files_skipped += tallies["skipped"]
+    result.files_no_date += tallies["no_date"]
+    result.errors += tallies["errors"]
+
+
 class Mover:
     def __init__(
         self,
@@ -37,37 +114,92 @@ class Mover:
     ) -> None:
         self.config = config
         self.manifest = manifest
+        # Directory listings for duplicate-name resolution, one per dir.
+        self._dir_names: dict[Path, set[str]] = {}
+        # Directories already created this run; mkdir is idempotent so a
+        # racing double-create is harmless and no lock is needed.
+        self._ensured_dirs: set[Path] = set()
+        # Shared-state lock for parallel execution; manifest recording
+        # needs none because ManifestWriter.record is queue-backed, and
+        # result counters are tallied on the coordinating thread only.
+        self._names_lock = threading.Lock()
 
     def execute(
         self, actions: list[FileAction], result: PipelineResult,
     ) -> PipelineResult:
         total = len(actions)
-        bar_width = 30
+        if total >= _SORT_THRESHOLD:
+            # Grouping by destination directory keeps each directory's
+            # inode hot in the dcache across its mkdir, transfers, and
+            # name-collision probes instead of bouncing between buckets.
+            actions = sorted(actions, key=_dest_sort_key)
+        # Dry-run stays sequential: it writes nothing, and sequential
+        # execution keeps its previewed names deterministic.
+        if self.config.io_workers > 1 and total > 1 and not self.config.dry_run:
+            return self._execute_parallel(actions, result)
+
+        tallies = _new_tallies()
         for i, action in enumerate(actions):
-            pct = (i + 1) * 100 // total
-            filled = bar_width * (i + 1) // total
-            bar = "#" * filled + "." * (bar_width - filled)
-            sys.stdout.write(
-                f"\r  Progress: [{bar}] {pct}% ({i + 1}/{total})"
-            )
-            sys.stdout.flush()
+            self._progress(i + 1, total)
             try:
-                self._execute_one(action, result)
+                tallies[self._execute_one(action)] += 1
             except Exception as e:
                 logger.error(f"Error processing {action.source.path}: {e}")
-                result.errors += 1
+                tallies["errors"] += 1
+        self._clear_progress(total)
+        _apply_tallies(result, tallies)
+        return result
+
+    def _execute_parallel(
+        self, actions: list[FileAction], result: PipelineResult,
+    ) -> PipelineResult:
+        """Run file operations on a thread pool; transfers are I/O-bound."""
+        total = len(actions)
+        done = 0
+        tallies = _new_tallies()
+        with ThreadPoolExecutor(max_workers=self.config.io_workers) as pool:
+            futures = {
+                pool.submit(self._execute_one, action): action
+                for action in actions
+            }
+            # Only this thread touches the tallies, so workers never
+            # contend on the result counters.
+            for future in as_completed(futures):
+                try:
+                    tallies[future.result()] += 1
+                except Exception as e:
+                    action = futures[future]
+                    logger.error(f"Error processing {action.source.path}: {e}")
+                    tallies["errors"] += 1
+                done += 1
+                self._progress(done, total)
+        self._clear_progress(total)
+        _apply_tallies(result, tallies)
+        return result
+
+    @staticmethod
+    def _progress(done: int, total: int) -> None:
+        bar_width = 30
+        pct = done * 100 // total
+        filled = bar_width * done // total
+        bar = "#" * filled + "." * (bar_width - filled)
+        sys.stdout.write(f"\r  Progress: [{bar}] {pct}% ({done}/{total})")
+        sys.stdout.flush()
+
+    @staticmethod
+    def _clear_progress(total: int) -> None:
         if total > 0:
             sys.stdout.write("\r" + " " * 60 + "\r")
             sys.stdout.flush()
-        return result
 
-    def _execute_one(self, fa: FileAction, result: PipelineResult) -> None:
+    def _execute_one(self, fa: FileAction) -> str:
+        """Perform one file action; returns its tally key (see _new_tallies)."""
         if fa.action == Action.SKIP:
-            logger.debug(f"SKIP: {fa.source.path} ({fa.reason})")
-            result.files_skipped += 1
-            return
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"SKIP: {fa.source.path} ({fa.reason})")
+            return "skipped"
 
-        dest = resolve_duplicate_name(fa.destination_path)
+        dest = self._next_free_name(fa.destination_path)
         prefix = "[DRY-RUN] " if self.config.dry_run else ""
 
         if fa.action in (Action.STORE, Action.NO_DATE):
@@ -75,45 +207,69 @@ class Mover:
             sidecar_records: list[dict[str, str]] = []
             for sc in fa.sidecars:
                 sc_dest = dest.parent / sc.path.name
-                sc_dest = resolve_duplicate_name(sc_dest)
+                sc_dest = self._next_free_name(sc_dest)
                 self._transfer(sc.path, sc_dest, prefix)
                 sidecar_records.append({
                     "source": str(sc.path),
                     "destination": str(sc_dest),
                 })
             self._record_operation(fa, dest, sidecar_records)
-            if fa.action == Action.NO_DATE:
-                result.files_no_date += 1
-            else:
-                result.files_stored += 1
+            return "no_date" if fa.action == Action.NO_DATE else "stored"
 
-        elif fa.action == Action.DISCARD_SOURCE:
+        if fa.action == Action.DISCARD_SOURCE:
             self._transfer(fa.source.path, dest, prefix)
             sidecar_records = []
             for sc in fa.sidecars:
                 sc_dest = self.config.discard / sc.path.name
-                sc_dest = resolve_duplicate_name(sc_dest)
+                sc_dest = self._next_free_name(sc_dest)
                 self._transfer(sc.path, sc_dest, prefix)
                 sidecar_records.append({
                     "source": str(sc.path),
                     "destination": str(sc_dest),
                 })
             self._record_operation(fa, dest, sidecar_records)
-            result.files_discarded += 1
+            return "discarded"
+
+        raise ValueError(f"Unhandled action: {fa.action}")
+
+    def _next_free_name(self, target: Path) -> Path:
+        """Resolve name collisions against a cached per-directory listing."""
+        with self._names_lock:
+            names = self._dir_names.get(target.parent)
+            if names is None:
+                names = _list_dir_names(target.parent)
+                self._dir_names[target.parent] = names
+            chosen = resolve_duplicate_name(target, names)
+            # Dry-run writes nothing, so the name is not actually taken.
+            if not self.config.dry_run:
+                names.add(chosen.name)
+            return chosen
 
     def _transfer(self, src: Path, dest: Path, prefix: str) -> None:
         """Copy or move a single file."""
-        logger.debug(f"{prefix}{self.config.mode.upper()}: {src} -> {dest}")
+        # Guard the f-string: formatting two paths per file adds up when the
+        # DEBUG record would be thrown away anyway.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{prefix}{self.config.mode.upper()}: {src} -> {dest}")
 
         if self.config.dry_run:
             return
 
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.parent not in self._ensured_dirs:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(dest.parent)
 
         if self.config.mode == "move":
-            shutil.move(str(src), str(dest))
+            try:
+                # Same-filesystem move is a single rename syscall; no data
+                # is read or written.
+                os.rename(src, dest)
+            except OSError:
+                # Cross-device (EXDEV) and friends: copy-and-delete.
+                shutil.move(str(src), str(dest))
         else:
-            shutil.copy2(str(src), str(dest))
+            if not _fast_copy(src, dest):
+                shutil.copy2(str(src), str(dest))
 
     def _record_operation(
         self,
@@ -24,7 +24,11 @@ class Pipeline:
         self.config = config
         self.run_id = run_id
         self.scanner = Scanner(config)
-        self.metadata = MetadataExtractor(batch_size=config.exiftool_batch_size)
+        self.metadata = MetadataExtractor(
+            batch_size=config.exiftool_batch_size,
+            workers=config.exiftool_workers,
+            trust_path_dates=config.trust_path_dates,
+        )
         self.strategy = get_strategy(config.match_strategy)
         self.resolver = Resolver(config)
         if config.dry_run:
@@ -60,7 +64,8 @@ class Pipeline:
 
         # Phase 2: Extract EXIF metadata (dates)
         logger.info("Phase 2/5: Extracting metadata via exiftool...")
-        file_records = self.metadata.enrich(media_files, sidecar_map)
+        with self.metadata:
+            file_records = self.metadata.enrich(media_files, sidecar_map)
 
         # Phase 3: Match against destination archive
         logger.info("Phase 3/5: Matching against destination archive...")
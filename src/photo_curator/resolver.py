@@ -22,6 +22,19 @@ class Resolver:
 
     def __init__(self, config: CuratorConfig) -> None:
         self.config = config
+        self._dir_cache: dict[Path, Path] = {}
+
+    def _resolved_dir(self, directory: Path) -> Path:
+        """Resolve a directory path, memoized.
+
+        Thousands of files share a handful of parent directories, so each
+        distinct directory pays for Path.resolve() exactly once per run.
+        """
+        cached = self._dir_cache.get(directory)
+        if cached is None:
+            cached = directory.resolve()
+            self._dir_cache[directory] = cached
+        return cached
 
     def resolve(self, match_results: list[MatchResult]) -> list[FileAction]:
         actions: list[FileAction] = []
@@ -41,8 +54,13 @@ class Resolver:
                 target_dir = self._target_dir(source)
                 target_path = target_dir / source.path.name
 
-                # Recursive mode: skip if already in correct location
-                if target_path.resolve() == source.path.resolve():
+                # Recursive mode: skip if already in correct location.
+                # The filename is shared by construction, so comparing the
+                # memoized resolved directories is enough.
+                if (
+                    self._resolved_dir(target_dir)
+                    == self._resolved_dir(source.path.parent)
+                ):
                     actions.append(FileAction(
                         source=source,
                         action=Action.SKIP,
@@ -12,7 +12,9 @@ from photo_curator.config import (
     MEDIA_EXTENSIONS,
     PHOTO_EXTENSIONS,
     SIDECAR_EXTENSIONS,
+    SKIP_DIRNAME_FIRST_CHARS,
     SKIP_DIRNAMES,
+    SKIP_FILENAME_FIRST_CHARS,
     SKIP_FILENAMES,
     VIDEO_EXTENSIONS,
     CuratorConfig,
@@ -22,6 +24,75 @@ from photo_curator.models import FileCategory, FileRecord
 logger = logging.getLogger(__name__)
 
 
+# Directory-relative stat support: with a dir_fd the kernel resolves only
+# the final path component instead of walking the whole path per file.
+_HAS_DIR_FD = os.stat in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+
+def _skip_dir(name: str) -> bool:
+    """True if a directory name is on the skip list (first-char fast path)."""
+    return (
+        name[0].lower() in SKIP_DIRNAME_FIRST_CHARS
+        and name.lower() in SKIP_DIRNAMES
+    )
+
+
+def _iter_entries(root: Path):
+    """Yield (DirEntry, extension, stat_result) for media/sidecar files.
+
+    Shared walker behind Scanner.scan and walk_destination: drives
+    os.scandir with an explicit stack so file type and name filters run on
+    the DirEntry the kernel returned, before any Path or stat work. Where
+    the platform supports it, files are stat'd relative to an open fd on
+    their directory, which keeps the kernel's path resolution to one
+    component regardless of tree depth.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError as e:
+            logger.warning(f"Cannot scan {current}: {e}")
+            continue
+        dir_fd = None
+        if _HAS_DIR_FD:
+            try:
+                dir_fd = os.open(current, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                dir_fd = None
+        try:
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _skip_dir(name):
+                            stack.append(entry.path)
+                        continue
+                    if (
+                        name[0].lower() in SKIP_FILENAME_FIRST_CHARS
+                        and name.lower() in SKIP_FILENAMES
+                    ):
+                        continue
+                    ext = os.path.splitext(name)[1].lower()
+                    if ext not in ALL_EXTENSIONS:
+                        continue
+                    try:
+                        if dir_fd is not None:
+                            stat = os.stat(
+                                name, dir_fd=dir_fd, follow_symlinks=False
+                            )
+                        else:
+                            stat = entry.stat(follow_symlinks=False)
+                    except OSError as e:
+                        logger.warning(f"Cannot stat {entry.path}: {e}")
+                        continue
+                    yield entry, ext, stat
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+
 def _categorize(ext: str) -> FileCategory:
     if ext in PHOTO_EXTENSIONS:
         return FileCategory.PHOTO
@@ -46,37 +117,19 @@ class Scanner:
         media_files: list[FileRecord] = []
         all_sidecars: list[FileRecord] = []
 
-        for root, dirs, files in os.walk(self.config.source):
-            dirs[:] = [d for d in dirs if d.lower() not in SKIP_DIRNAMES]
-
-            root_path = Path(root)
-            for filename in files:
-                if filename.lower() in SKIP_FILENAMES:
-                    continue
-
-                file_path = root_path / filename
-                ext = file_path.suffix.lower()
-
-                if ext not in MEDIA_EXTENSIONS and ext not in SIDECAR_EXTENSIONS:
-                    continue
-
-                try:
-                    stat = file_path.stat()
-                except OSError as e:
-                    logger.warning(f"Cannot stat {file_path}: {e}")
-                    continue
-
-                record = FileRecord(
-                    path=file_path,
-                    category=_categorize(ext),
-                    size=stat.st_size,
-                    extension=ext,
-                )
-
-                if ext in MEDIA_EXTENSIONS:
-                    media_files.append(record)
-                else:
-                    all_sidecars.append(record)
+        for entry, ext, stat in _iter_entries(self.config.source):
+            record = FileRecord(
+                path=Path(entry.path),
+                category=_categorize(ext),
+                size=stat.st_size,
+                extension=ext,
+                mtime_ns=stat.st_mtime_ns,
+            )
+
+            if ext in MEDIA_EXTENSIONS:
+                media_files.append(record)
+            else:
+                all_sidecars.append(record)
 
         sidecar_map = self._map_sidecars(media_files, all_sidecars)
         return media_files, sidecar_map
@@ -111,36 +164,20 @@ class Scanner:
         return dict(result)
 
 
-def walk_destination(destination: Path) -> list[tuple[Path, int]]:
-    """Walk a destination directory and return all media/sidecar files with sizes.
+def walk_destination(destination: Path) -> list[tuple[Path, int, int]]:
+    """Walk a destination directory and return all media/sidecar files.
 
-    Shared helper used by matching strategies to build their indexes.
+    Shared helper used by matching strategies to build their indexes; walks
+    the same _iter_entries generator as Scanner.scan, so size and mtime come
+    from the directory entries the kernel already returned.
 
     Returns:
-        list of (file_path, file_size) tuples
+        list of (file_path, file_size, mtime_ns) tuples
     """
-    results: list[tuple[Path, int]] = []
-
-    if not destination.exists():
-        return results
-
-    for root, dirs, files in os.walk(destination):
-        dirs[:] = [d for d in dirs if d.lower() not in SKIP_DIRNAMES]
-
-        root_path = Path(root)
-        for filename in files:
-            file_path = root_path / filename
-            ext = file_path.suffix.lower()
-            if ext not in ALL_EXTENSIONS:
-                continue
-
-            try:
-                stat = file_path.stat()
-                results.append((file_path, stat.st_size))
-            except OSError:
-                pass
-
-    return results
+    return [
+        (Path(entry.path), stat.st_size, stat.st_mtime_ns)
+        for entry, _ext, stat in _iter_entries(destination)
+    ]
 
 
 def count_media(directory: Path) -> tuple[int, int, int]:
@@ -150,7 +187,11 @@ def count_media(directory: Path) -> tuple[int, int, int]:
         (total, photos, videos) counts
     """
     files = walk_destination(directory)
-    photos = sum(1 for path, _ in files if path.suffix.lower() in PHOTO_EXTENSIONS)
-    videos = sum(1 for path, _ in files if path.suffix.lower() in VIDEO_EXTENSIONS)
+    photos = sum(
+        1 for path, _, _ in files if path.suffix.lower() in PHOTO_EXTENSIONS
+    )
+    videos = sum(
+        1 for path, _, _ in files if path.suffix.lower() in VIDEO_EXTENSIONS
+    )
     total = photos + videos
     return total, photos, videos
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import logging
 import os
@@ -107,15 +108,22 @@ def _undo_one(
     src_path = Path(source)
     prefix = "[DRY-RUN] " if dry_run else ""
 
-    if not dest_path.exists():
+    # One stat answers both the existence and the size check.
+    try:
+        dest_stat = dest_path.stat()
+    except FileNotFoundError:
         logger.warning(f"SKIP (already gone): {dest_path}")
         return True  # Idempotent — not an error
+    except OSError as e:
+        # Permission denied, stale mount, symlink loop, ...: count it as
+        # an error and keep going so the rest of the run is still undone.
+        logger.warning(f"SKIP (cannot stat): {dest_path} ({e})")
+        return False
 
-    # Validate size if available
-    if source_size is not None and dest_path.stat().st_size != source_size:
+    if source_size is not None and dest_stat.st_size != source_size:
         logger.warning(
             f"SKIP (size mismatch): {dest_path} "
-            f"(expected {source_size}, got {dest_path.stat().st_size})"
+            f"(expected {source_size}, got {dest_stat.st_size})"
         )
         return False
 
@@ -140,11 +148,13 @@ def _remove_empty_parents(directory: Path) -> None:
     """Remove empty directories up the tree (stops at first non-empty)."""
     try:
         while directory != directory.parent:
-            if not any(directory.iterdir()):
-                directory.rmdir()
-                directory = directory.parent
-            else:
-                break
+            # scandir stops at the first entry; no Path objects are built
+            # just to decide emptiness.
+            with os.scandir(directory) as entries:
+                if next(entries, None) is not None:
+                    break
+            directory.rmdir()
+            directory = directory.parent
     except OSError:
         pass  # Permission error or race condition — safe to ignore
 
@@ -155,7 +165,15 @@ def _load_manifest(path: Path) -> dict:
         raise SystemExit(f"Error: manifest not found: {path}")
 
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        # Sniff the gzip magic rather than trusting the suffix, so renamed
+        # compressed manifests (--compress-manifest runs) still load.
+        with open(path, "rb") as f:
+            is_gzip = f.read(2) == b"\x1f\x8b"
+        if is_gzip:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        else:
+            data = json.loads(path.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError) as e:
         raise SystemExit(f"Error: cannot read manifest: {e}")
 
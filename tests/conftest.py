@@ -1,11 +1,91 @@
 """Shared test fixtures."""
 
+import functools
+import os
+import re
+import shutil
+import sys
+
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 
 from photo_curator.config import CuratorConfig
 
 
+def pytest_configure(config):
+    """Prefer a RAM-backed temp root on Linux so test I/O never hits disk.
+
+    An explicit --basetemp always wins; elsewhere (or without a writable
+    /dev/shm) pytest's default temp root is used. Per-uid suffix keeps
+    shared CI hosts from colliding.
+    """
+    if config.option.basetemp:
+        return
+    shm = Path("/dev/shm")
+    if sys.platform.startswith("linux") and os.access(shm, os.W_OK):
+        config.option.basetemp = str(shm / f"pytest-photo-{os.getuid()}")
+
+
+@functools.lru_cache(maxsize=1)
+def _has_exiftool() -> bool:
+    """True if exiftool is on PATH; probed once per test session.
+
+    CI images that know the answer can set PHOTO_CURATOR_HAS_EXIFTOOL=1|0
+    to skip even the PATH scan.
+    """
+    override = os.environ.get("PHOTO_CURATOR_HAS_EXIFTOOL")
+    if override is not None:
+        return override == "1"
+    return shutil.which("exiftool") is not None
+
+
+requires_exiftool = pytest.mark.skipif(
+    not _has_exiftool(), reason="exiftool not installed"
+)
+
+
+@pytest.fixture
+def tmp_path(tmp_path_factory, request) -> Path:
+    """Lighter-weight tmp_path: one mkdir under the session temp root.
+
+    pytest's built-in tmp_path creates a numbered per-test root and does
+    retention bookkeeping (pruning old runs, lock files) on every test;
+    a plain mktemp under the session root is just a mkdir, which adds up
+    across the suite.
+    """
+    name = re.sub(r"\W", "_", request.node.name)[:50] or "test"
+    return tmp_path_factory.mktemp(name)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Point the hash cache at a temp directory so tests never touch ~/.cache."""
+    monkeypatch.setenv(
+        "PHOTO_CURATOR_CACHE_DIR", str(tmp_path_factory.mktemp("cache"))
+    )
+
+
+@pytest.fixture(scope="session")
+def tiny_jpeg() -> bytes:
+    """Minimal JPEG stub (SOI + APP0 marker, no EXIF), built once per session."""
+    return b"\xff\xd8\xff\xe0" + b"\x00" * 100
+
+
+@pytest.fixture
+def workdirs(tmp_path: Path) -> SimpleNamespace:
+    """Pre-created source/dest/discard/logs directories in one fixture."""
+    dirs = SimpleNamespace(
+        src=tmp_path / "source",
+        dest=tmp_path / "dest",
+        discard=tmp_path / "discard",
+        logs=tmp_path / "logs",
+    )
+    for d in vars(dirs).values():
+        d.mkdir()
+    return dirs
+
+
 @pytest.fixture
 def source_dir(tmp_path: Path) -> Path:
     src = tmp_path / "source"
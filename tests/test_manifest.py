@@ -1,5 +1,7 @@
 """Tests for the ManifestWriter module."""
 
+import dataclasses
+import gzip
 import json
 from pathlib import Path
 
@@ -121,6 +123,26 @@ class TestManifestWriter:
         assert len(data["operations"][0]["sidecars"]) == 1
         assert data["operations"][0]["sidecars"][0]["source"] == "/src/photo.xmp"
 
+    def test_compressed_manifest(self, tmp_path):
+        config = dataclasses.replace(_config(tmp_path), compress_manifest=True)
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        writer = ManifestWriter("test-run-008", config, log_dir)
+
+        writer.record(OperationRecord(
+            action="store",
+            source="/src/photo.jpg",
+            destination="/dest/2024/01/photo.jpg",
+            source_size=1234,
+        ))
+        path = writer.finalize(PipelineResult(files_stored=1))
+
+        assert path.name.endswith(".json.gz")
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["run_id"] == "test-run-008"
+        assert len(data["operations"]) == 1
+
     def test_creates_log_dir_if_missing(self, tmp_path):
         config = _config(tmp_path)
         log_dir = tmp_path / "new_logs"
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from photo_curator.matching.content_hash import ContentHashStrategy, sha256_file
 from photo_curator.matching.filename_size import FilenameSizeStrategy
+from photo_curator.matching.hash_cache import HashCache
 from photo_curator.matching.registry import available_strategies, get_strategy
 from photo_curator.models import FileCategory, FileRecord
 
@@ -211,9 +212,67 @@ class TestContentHashStrategy:
         strategy = ContentHashStrategy()
         index = strategy.build_index(tmp_path)
 
+        # Index is keyed by size; digests are only computed on collision.
         assert len(index) == 1
-        digest = sha256_file(tmp_path / "2024" / "01" / "IMG_001.jpg")
-        assert digest in index
+        assert len(content) in index
+        [(path, digest)] = index[len(content)]
+        assert path == tmp_path / "2024" / "01" / "IMG_001.jpg"
+        assert digest is None
+
+
+class TestHashCache:
+    def test_put_get_roundtrip(self, tmp_path):
+        cache = HashCache(tmp_path / "hashes.sqlite")
+        cache.put(Path("/a/photo.jpg"), 100, 12345, "abc")
+        cache.flush()
+        assert cache.get(Path("/a/photo.jpg"), 100, 12345) == "abc"
+        cache.close()
+
+    def test_miss_on_changed_file(self, tmp_path):
+        cache = HashCache(tmp_path / "hashes.sqlite")
+        cache.put(Path("/a/photo.jpg"), 100, 12345, "abc")
+        cache.flush()
+        assert cache.get(Path("/a/photo.jpg"), 200, 12345) is None
+        assert cache.get(Path("/a/photo.jpg"), 100, 99999) is None
+        cache.close()
+
+    def test_default_uses_env_override(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PHOTO_CURATOR_CACHE_DIR", str(tmp_path / "cache"))
+        cache = HashCache.default()
+        assert cache is not None
+        cache.close()
+        assert (tmp_path / "cache" / "hashes.sqlite").exists()
+
+    def test_strategy_reuses_cached_digest(self, tmp_path, monkeypatch):
+        """A second run finds the digest in the cache without re-reading."""
+        content = b"\xff\xd8" + b"\x00" * 100
+        src_file = tmp_path / "photo.jpg"
+        src_file.write_bytes(content)
+        dup_file = tmp_path / "copy.jpg"
+        dup_file.write_bytes(content)
+        records = [
+            _record("photo.jpg", len(content), path=src_file),
+            _record("copy.jpg", len(content), path=dup_file),
+        ]
+
+        cache = HashCache(tmp_path / "hashes.sqlite")
+        strategy = ContentHashStrategy(cache=cache)
+        results = strategy.match_all(records, {})
+        assert results[1].is_duplicate is True
+
+        st = src_file.stat()
+        cached = cache.get(src_file, st.st_size, st.st_mtime_ns)
+        assert cached == sha256_file(src_file)
+
+        # Second run: hashing is never called, digests come from the cache.
+        strategy2 = ContentHashStrategy(cache=cache)
+        monkeypatch.setattr(
+            strategy2, "_try_hash",
+            lambda path: pytest.fail("cache miss caused a re-hash"),
+        )
+        results2 = strategy2.match_all(records, {})
+        assert results2[1].is_duplicate is True
+        cache.close()
 
 
 class TestRegistry:
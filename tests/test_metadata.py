@@ -1,6 +1,18 @@
 """Tests for the metadata module."""
 
-from photo_curator.metadata import parse_date
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from photo_curator.metadata import (
+    ExifDateCache,
+    ExifToolProcess,
+    MetadataExtractor,
+    _infer_date_from_path,
+    parse_date,
+)
+from photo_curator.models import FileCategory, FileRecord
 
 
 def test_parse_date_valid():
@@ -42,3 +54,76 @@ def test_parse_date_garbage():
 def test_parse_date_boundary_valid():
     assert parse_date("1900:01:01 00:00:00") == ("1900", "01")
     assert parse_date("2100:12:31 23:59:59") == ("2100", "12")
+
+
+def test_infer_date_from_path():
+    assert _infer_date_from_path(Path("/archive/2020/07/photo.jpg")) == ("2020", "07")
+    assert _infer_date_from_path(Path("/archive/2020/7/photo.jpg")) == ("2020", "07")
+
+
+def test_infer_date_from_path_rejects_out_of_range():
+    assert _infer_date_from_path(Path("/archive/1800/07/photo.jpg")) is None
+    assert _infer_date_from_path(Path("/archive/2020/13/photo.jpg")) is None
+
+
+def test_infer_date_from_path_rejects_non_date_dirs():
+    assert _infer_date_from_path(Path("/vacation/beach/photo.jpg")) is None
+    assert _infer_date_from_path(Path("/archive/20200/07/photo.jpg")) is None
+    assert _infer_date_from_path(Path("photo.jpg")) is None
+
+
+def test_enrich_trusts_path_dates(tmp_path, monkeypatch):
+    """With trust_path_dates, organized files never reach exiftool."""
+    record = FileRecord(
+        path=tmp_path / "2021" / "03" / "img.jpg",
+        category=FileCategory.PHOTO,
+        size=10,
+        extension=".jpg",
+    )
+    extractor = MetadataExtractor(trust_path_dates=True)
+    monkeypatch.setattr(
+        extractor,
+        "_batch_extract_dates",
+        lambda paths: pytest.fail("exiftool should not be called"),
+    )
+    enriched = extractor.enrich([record], {})
+    assert enriched[0].year == "2021"
+    assert enriched[0].month == "03"
+
+
+def test_exiftool_process_times_out():
+    """A hung worker is killed by the watchdog and raises, not blocks."""
+    proc = ExifToolProcess.__new__(ExifToolProcess)  # skip spawning exiftool
+    proc._proc = subprocess.Popen(
+        ["sleep", "60"],  # never answers: simulates a hang
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    proc._seq = 0
+    try:
+        with pytest.raises(RuntimeError, match="timed out"):
+            proc.execute(["-json"], timeout=0.2)
+        proc._proc.wait(timeout=5)  # worker was killed, not left running
+    finally:
+        proc._proc.kill()
+        proc._proc.wait()
+
+
+def test_date_cache_roundtrip(tmp_path):
+    cache = ExifDateCache(tmp_path / "exif.sqlite")
+    cache.put(Path("/a/photo.jpg"), 100, 12345, "2024:01:15 10:30:00")
+    cache.flush()
+    assert cache.get(Path("/a/photo.jpg"), 100, 12345) == "2024:01:15 10:30:00"
+    cache.close()
+
+
+def test_date_cache_stores_dateless_files(tmp_path):
+    """An empty string is a hit (known dateless), distinct from a miss."""
+    cache = ExifDateCache(tmp_path / "exif.sqlite")
+    cache.put(Path("/a/scan.jpg"), 100, 12345, "")
+    cache.flush()
+    assert cache.get(Path("/a/scan.jpg"), 100, 12345) == ""
+    assert cache.get(Path("/a/scan.jpg"), 100, 99999) is None
+    cache.close()
@@ -1,5 +1,6 @@
 """Tests for the Mover module."""
 
+import json
 from pathlib import Path
 
 from photo_curator.config import CuratorConfig
@@ -204,12 +205,15 @@ class TestMover:
             destination_path=dest_path,
         )
 
-        mover.execute([action], PipelineResult())
+        result = PipelineResult()
+        mover.execute([action], result)
+        manifest_path = manifest.finalize(result)
 
-        assert len(manifest.operations) == 1
-        assert manifest.operations[0].action == "store"
-        assert manifest.operations[0].source == str(src_file)
-        assert manifest.operations[0].destination == str(dest_path)
+        ops = json.loads(manifest_path.read_text())["operations"]
+        assert len(ops) == 1
+        assert ops[0]["action"] == "store"
+        assert ops[0]["source"] == str(src_file)
+        assert ops[0]["destination"] == str(dest_path)
 
     def test_manifest_records_discard(self, tmp_path):
         """ManifestWriter should receive a record for discard operations."""
@@ -236,7 +240,10 @@ class TestMover:
             destination_path=discard_path,
         )
 
-        mover.execute([action], PipelineResult())
+        result = PipelineResult()
+        mover.execute([action], result)
+        manifest_path = manifest.finalize(result)
 
-        assert len(manifest.operations) == 1
-        assert manifest.operations[0].action == "discard_source"
+        ops = json.loads(manifest_path.read_text())["operations"]
+        assert len(ops) == 1
+        assert ops[0]["action"] == "discard_source"
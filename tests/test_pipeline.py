@@ -1,25 +1,54 @@
 """Integration tests for the full pipeline."""
 
-import subprocess
+import dataclasses
+import os
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
 from photo_curator.config import CuratorConfig
+from photo_curator.metadata import ExifToolProcess, MetadataExtractor
 from photo_curator.pipeline import Pipeline
+from tests.conftest import _has_exiftool, requires_exiftool
 
+pytestmark = pytest.mark.integration
 
-def _has_exiftool() -> bool:
-    try:
-        subprocess.run(["exiftool", "-ver"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
 
+@pytest.fixture(scope="session")
+def exiftool_daemon():
+    """One exiftool -stay_open worker shared by every integration test.
 
-requires_exiftool = pytest.mark.skipif(
-    not _has_exiftool(), reason="exiftool not installed"
+    Each Pipeline otherwise spawns its own exiftool for a single-file
+    batch, paying the Perl interpreter warmup per test.
+    """
+    if not _has_exiftool():
+        yield None
+        return
+    proc = ExifToolProcess()
+    yield proc
+    proc.close()
+
+
+@pytest.fixture(autouse=True)
+def _shared_exiftool(exiftool_daemon, monkeypatch):
+    """Route every MetadataExtractor in this module through the daemon."""
+    if exiftool_daemon is None:
+        return
+    monkeypatch.setattr(
+        MetadataExtractor, "_get_process", lambda self: exiftool_daemon
+    )
+
+
+_CONFIG_TEMPLATE = CuratorConfig(
+    source=Path("/"),
+    destination=Path("/"),
+    discard=Path("/"),
+    mode="copy",
+    match_strategy="filename-size",
+    dry_run=False,
+    exiftool_batch_size=500,
+    verbose=False,
+    log_dir=Path("/"),
 )
 
 
@@ -27,113 +56,76 @@ def _config(
     source, dest, discard, mode="copy", dry_run=False, strategy="filename-size",
     log_dir=None,
 ) -> CuratorConfig:
-    return CuratorConfig(
+    return dataclasses.replace(
+        _CONFIG_TEMPLATE,
         source=source,
         destination=dest,
         discard=discard,
         mode=mode,
         match_strategy=strategy,
         dry_run=dry_run,
-        exiftool_batch_size=500,
-        verbose=False,
         log_dir=log_dir or dest,
     )
 
 
 @requires_exiftool
-def test_pipeline_new_files_no_exif(tmp_path):
+def test_pipeline_new_files_no_exif(workdirs, tiny_jpeg):
     """Files without EXIF go to NoDate/."""
-    src = tmp_path / "source"
-    src.mkdir()
-    dest = tmp_path / "dest"
-    dest.mkdir()
-    discard = tmp_path / "discard"
-    discard.mkdir()
-
     # Create a minimal JPEG (no real EXIF)
-    (src / "photo.jpg").write_bytes(b"\xff\xd8\xff\xe0" + b"\x00" * 100)
+    (workdirs.src / "photo.jpg").write_bytes(tiny_jpeg)
 
-    config = _config(src, dest, discard)
+    config = _config(workdirs.src, workdirs.dest, workdirs.discard)
     result = Pipeline(config, "test-run").run()
 
     assert result.files_scanned == 1
     assert result.files_no_date == 1
-    assert (dest / "NoDate" / "photo.jpg").exists()
+    assert (workdirs.dest / "NoDate" / "photo.jpg").exists()
 
 
 @requires_exiftool
-def test_pipeline_dry_run_no_writes(tmp_path):
+def test_pipeline_dry_run_no_writes(workdirs, tiny_jpeg):
     """Dry run should not create any files."""
-    src = tmp_path / "source"
-    src.mkdir()
-    dest = tmp_path / "dest"
-    dest.mkdir()
-    discard = tmp_path / "discard"
-    discard.mkdir()
-
-    (src / "photo.jpg").write_bytes(b"\xff\xd8\xff\xe0" + b"\x00" * 100)
+    (workdirs.src / "photo.jpg").write_bytes(tiny_jpeg)
 
-    config = _config(src, dest, discard, dry_run=True)
+    config = _config(workdirs.src, workdirs.dest, workdirs.discard, dry_run=True)
     result = Pipeline(config, "test-run").run()
 
     assert result.files_scanned == 1
-    assert not (dest / "NoDate" / "photo.jpg").exists()
+    assert not (workdirs.dest / "NoDate" / "photo.jpg").exists()
 
 
 @requires_exiftool
-def test_pipeline_duplicate_goes_to_discard(tmp_path):
+def test_pipeline_duplicate_goes_to_discard(workdirs, tiny_jpeg):
     """A file matching name+size in dest should be discarded."""
-    src = tmp_path / "source"
-    src.mkdir()
-    dest = tmp_path / "dest"
-    dest.mkdir()
-    discard = tmp_path / "discard"
-    discard.mkdir()
-
-    content = b"\xff\xd8\xff\xe0" + b"\x00" * 100
-
-    # Put the same file in source and destination
-    (src / "photo.jpg").write_bytes(content)
-    (dest / "2024" / "01").mkdir(parents=True)
-    (dest / "2024" / "01" / "photo.jpg").write_bytes(content)
+    # Put the same file in source and destination; a hard link writes the
+    # content once and both paths share the inode.
+    (workdirs.src / "photo.jpg").write_bytes(tiny_jpeg)
+    (workdirs.dest / "2024" / "01").mkdir(parents=True)
+    os.link(workdirs.src / "photo.jpg", workdirs.dest / "2024" / "01" / "photo.jpg")
 
-    config = _config(src, dest, discard)
+    config = _config(workdirs.src, workdirs.dest, workdirs.discard)
     result = Pipeline(config, "test-run").run()
 
     assert result.files_discarded == 1
-    assert (discard / "photo.jpg").exists()
+    assert (workdirs.discard / "photo.jpg").exists()
 
 
 @requires_exiftool
-def test_pipeline_move_mode_removes_source(tmp_path):
+def test_pipeline_move_mode_removes_source(workdirs, tiny_jpeg):
     """In move mode, source file should be gone after processing."""
-    src = tmp_path / "source"
-    src.mkdir()
-    dest = tmp_path / "dest"
-    dest.mkdir()
-    discard = tmp_path / "discard"
-    discard.mkdir()
+    src_file = workdirs.src / "unique.jpg"
+    src_file.write_bytes(tiny_jpeg)
 
-    src_file = src / "unique.jpg"
-    src_file.write_bytes(b"\xff\xd8\xff\xe0" + b"\x00" * 50)
-
-    config = _config(src, dest, discard, mode="move")
+    config = _config(workdirs.src, workdirs.dest, workdirs.discard, mode="move")
     result = Pipeline(config, "test-run").run()
 
     assert result.files_scanned == 1
     assert not src_file.exists()
 
 
-def test_pipeline_empty_source(tmp_path):
+def test_pipeline_empty_source(workdirs):
     """An empty source directory should produce zero results."""
-    src = tmp_path / "source"
-    src.mkdir()
-    dest = tmp_path / "dest"
-    dest.mkdir()
-    discard = tmp_path / "discard"
-    discard.mkdir()
-
-    config = _config(src, dest, discard)
+    config = _config(workdirs.src, workdirs.dest, workdirs.discard)
     result = Pipeline(config, "test-run").run()
 
     assert result.files_scanned == 0
@@ -141,45 +133,38 @@ def test_pipeline_empty_source(tmp_path):
 
 
 @requires_exiftool
-def test_pipeline_content_hash_catches_renamed_duplicate(tmp_path):
+def test_pipeline_content_hash_catches_renamed_duplicate(workdirs, tiny_jpeg):
     """content-hash detects duplicate even when filename differs."""
-    src = tmp_path / "source"
-    src.mkdir()
-    dest = tmp_path / "dest"
-    dest.mkdir()
-    discard = tmp_path / "discard"
-    discard.mkdir()
-
-    content = b"\xff\xd8\xff\xe0" + b"\x00" * 100
-
-    # Same content, different names
-    (src / "renamed_copy.jpg").write_bytes(content)
-    (dest / "2024" / "01").mkdir(parents=True)
-    (dest / "2024" / "01" / "original.jpg").write_bytes(content)
+    # Same content, different names (hard link: one write, shared inode)
+    (workdirs.src / "renamed_copy.jpg").write_bytes(tiny_jpeg)
+    (workdirs.dest / "2024" / "01").mkdir(parents=True)
+    os.link(
+        workdirs.src / "renamed_copy.jpg",
+        workdirs.dest / "2024" / "01" / "original.jpg",
+    )
 
-    config = _config(src, dest, discard, strategy="content-hash")
+    config = _config(
+        workdirs.src, workdirs.dest, workdirs.discard, strategy="content-hash"
+    )
     result = Pipeline(config, "test-run").run()
 
     assert result.files_discarded == 1
-    assert (discard / "renamed_copy.jpg").exists()
+    assert (workdirs.discard / "renamed_copy.jpg").exists()
 
 
 @requires_exiftool
-def test_pipeline_content_hash_different_content_not_duplicate(tmp_path):
+def test_pipeline_content_hash_different_content_not_duplicate(workdirs, tiny_jpeg):
     """content-hash does NOT flag same-named files with different content."""
-    src = tmp_path / "source"
-    src.mkdir()
-    dest = tmp_path / "dest"
-    dest.mkdir()
-    discard = tmp_path / "discard"
-    discard.mkdir()
-
     # Same name, different content
-    (src / "photo.jpg").write_bytes(b"\xff\xd8\xff\xe0" + b"\x00" * 100)
-    (dest / "2024" / "01").mkdir(parents=True)
-    (dest / "2024" / "01" / "photo.jpg").write_bytes(b"\xff\xd8\xff\xe0" + b"\x01" * 100)
+    (workdirs.src / "photo.jpg").write_bytes(tiny_jpeg)
+    (workdirs.dest / "2024" / "01").mkdir(parents=True)
+    (workdirs.dest / "2024" / "01" / "photo.jpg").write_bytes(
+        b"\xff\xd8\xff\xe0" + b"\x01" * 100
+    )
 
-    config = _config(src, dest, discard, strategy="content-hash")
+    config = _config(
+        workdirs.src, workdirs.dest, workdirs.discard, strategy="content-hash"
+    )
     result = Pipeline(config, "test-run").run()
 
     assert result.files_discarded == 0
@@ -1,22 +1,29 @@
 """Tests for the Resolver module."""
 
+import dataclasses
 from pathlib import Path
 
 from photo_curator.config import CuratorConfig
 from photo_curator.models import Action, FileCategory, FileRecord, MatchResult
 from photo_curator.resolver import Resolver
 
+_CONFIG_TEMPLATE = CuratorConfig(
+    source=Path("/"),
+    destination=Path("/"),
+    discard=Path("/"),
+    mode="copy",
+    match_strategy="filename-size",
+    dry_run=False,
+    exiftool_batch_size=500,
+    verbose=False,
+    log_dir=Path("/"),
+)
+
 
 def _config(dest: Path, discard: Path) -> CuratorConfig:
-    return CuratorConfig(
-        source=dest,  # doesn't matter for resolver tests
-        destination=dest,
-        discard=discard,
-        mode="copy",
-        match_strategy="filename-size",
-        dry_run=False,
-        exiftool_batch_size=500,
-        verbose=False,
+    # source doesn't matter for resolver tests
+    return dataclasses.replace(
+        _CONFIG_TEMPLATE, source=dest, destination=dest, discard=discard,
         log_dir=dest,
     )
 
@@ -5,10 +5,14 @@ from pathlib import Path
 from photo_curator.models import FileCategory
 from photo_curator.scanner import Scanner, count_media, walk_destination
 
+# Shared stub contents, built once at import instead of per test.
+_JPEG_STUB = b"\xff\xd8" + b"\x00" * 100
+_ZEROS = b"\x00" * 200  # slice for arbitrary-size filler
+
 
 def test_scan_finds_media_files(make_config, source_dir):
-    (source_dir / "photo.jpg").write_bytes(b"\xff\xd8" + b"\x00" * 100)
-    (source_dir / "video.mp4").write_bytes(b"\x00" * 200)
+    (source_dir / "photo.jpg").write_bytes(_JPEG_STUB)
+    (source_dir / "video.mp4").write_bytes(_ZEROS)
 
     config = make_config()
     scanner = Scanner(config)
@@ -20,8 +24,8 @@ def test_scan_finds_media_files(make_config, source_dir):
 
 
 def test_scan_categorizes_correctly(make_config, source_dir):
-    (source_dir / "pic.cr2").write_bytes(b"\x00" * 50)
-    (source_dir / "clip.mov").write_bytes(b"\x00" * 50)
+    (source_dir / "pic.cr2").write_bytes(_ZEROS[:50])
+    (source_dir / "clip.mov").write_bytes(_ZEROS[:50])
 
     config = make_config()
     media, _ = Scanner(config).scan()
@@ -34,7 +38,7 @@ def test_scan_categorizes_correctly(make_config, source_dir):
 def test_scan_recursive(make_config, source_dir):
     sub = source_dir / "sub" / "deep"
     sub.mkdir(parents=True)
-    (sub / "nested.jpg").write_bytes(b"\x00" * 10)
+    (sub / "nested.jpg").write_bytes(_ZEROS[:10])
 
     config = make_config()
     media, _ = Scanner(config).scan()
@@ -44,9 +48,9 @@ def test_scan_recursive(make_config, source_dir):
 
 
 def test_scan_skips_junk_files(make_config, source_dir):
-    (source_dir / "Thumbs.db").write_bytes(b"\x00" * 10)
-    (source_dir / ".DS_Store").write_bytes(b"\x00" * 10)
-    (source_dir / "real.jpg").write_bytes(b"\x00" * 10)
+    (source_dir / "Thumbs.db").write_bytes(_ZEROS[:10])
+    (source_dir / ".DS_Store").write_bytes(_ZEROS[:10])
+    (source_dir / "real.jpg").write_bytes(_ZEROS[:10])
 
     config = make_config()
     media, _ = Scanner(config).scan()
@@ -58,8 +62,8 @@ def test_scan_skips_junk_files(make_config, source_dir):
 def test_scan_skips_junk_dirs(make_config, source_dir):
     junk = source_dir / ".picasaoriginals"
     junk.mkdir()
-    (junk / "hidden.jpg").write_bytes(b"\x00" * 10)
-    (source_dir / "visible.jpg").write_bytes(b"\x00" * 10)
+    (junk / "hidden.jpg").write_bytes(_ZEROS[:10])
+    (source_dir / "visible.jpg").write_bytes(_ZEROS[:10])
 
     config = make_config()
     media, _ = Scanner(config).scan()
@@ -69,7 +73,7 @@ def test_scan_skips_junk_dirs(make_config, source_dir):
 
 
 def test_sidecar_mapping(make_config, source_dir):
-    (source_dir / "IMG_001.jpg").write_bytes(b"\x00" * 100)
+    (source_dir / "IMG_001.jpg").write_bytes(_ZEROS[:100])
     (source_dir / "IMG_001.xmp").write_text("<xmp/>")
 
     config = make_config()
@@ -94,15 +98,16 @@ def test_orphan_sidecar_not_in_map(make_config, source_dir):
 
 def test_walk_destination(dest_dir):
     (dest_dir / "2024" / "01").mkdir(parents=True)
-    content = b"\xff\xd8" + b"\x00" * 100
+    content = _JPEG_STUB
     (dest_dir / "2024" / "01" / "IMG_001.jpg").write_bytes(content)
 
     files = walk_destination(dest_dir)
 
     assert len(files) == 1
-    path, size = files[0]
+    path, size, mtime_ns = files[0]
     assert path.name == "IMG_001.jpg"
     assert size == len(content)
+    assert mtime_ns == path.stat().st_mtime_ns
 
 
 def test_walk_destination_empty(dest_dir):
@@ -117,9 +122,9 @@ def test_walk_destination_nonexistent(tmp_path):
 
 def test_count_media(tmp_path):
     (tmp_path / "2024" / "01").mkdir(parents=True)
-    (tmp_path / "2024" / "01" / "photo.jpg").write_bytes(b"\x00" * 10)
-    (tmp_path / "2024" / "01" / "photo2.png").write_bytes(b"\x00" * 10)
-    (tmp_path / "2024" / "01" / "clip.mp4").write_bytes(b"\x00" * 10)
+    (tmp_path / "2024" / "01" / "photo.jpg").write_bytes(_ZEROS[:10])
+    (tmp_path / "2024" / "01" / "photo2.png").write_bytes(_ZEROS[:10])
+    (tmp_path / "2024" / "01" / "clip.mp4").write_bytes(_ZEROS[:10])
     (tmp_path / "2024" / "01" / "sidecar.xmp").write_text("<xmp/>")
 
     total, photos, videos = count_media(tmp_path)
@@ -139,7 +144,7 @@ def test_count_media_empty(tmp_path):
 def test_scan_ignores_unknown_extensions(make_config, source_dir):
     (source_dir / "readme.txt").write_text("hello")
     (source_dir / "data.csv").write_text("a,b")
-    (source_dir / "real.png").write_bytes(b"\x00" * 10)
+    (source_dir / "real.png").write_bytes(_ZEROS[:10])
 
     config = make_config()
     media, _ = Scanner(config).scan()
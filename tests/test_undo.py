@@ -1,54 +1,89 @@
 """Tests for the undo module."""
 
+import copy
+import gzip
 import json
+import os
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 from photo_curator.undo import undo, _load_manifest
 
+_MANIFEST_TEMPLATE = {
+    "schema_version": "1.0",
+    "run_id": "test-run",
+    "timestamp": "2026-01-01T00:00:00",
+    "config": {
+        "source": "/tmp/source",
+        "destination": "/tmp/dest",
+        "discard": "/tmp/discard",
+        "mode": "copy",
+        "match_strategy": "filename-size",
+        "dry_run": False,
+    },
+    "operations": [],
+    "summary": {},
+}
+
+
+def _glob_scandir(directory: Path, suffix: str) -> list[Path]:
+    """scandir-based stand-in for Path.glob(f"*{suffix}"): one readdir, no restats."""
+    with os.scandir(directory) as entries:
+        return [Path(e.path) for e in entries if e.name.endswith(suffix)]
+
 
 def _write_manifest(path: Path, mode: str, operations: list, dry_run=False) -> Path:
     """Helper to create a test manifest file."""
-    manifest = {
-        "schema_version": "1.0",
-        "run_id": "test-run",
-        "timestamp": "2026-01-01T00:00:00",
-        "config": {
-            "source": "/tmp/source",
-            "destination": "/tmp/dest",
-            "discard": "/tmp/discard",
-            "mode": mode,
-            "match_strategy": "filename-size",
-            "dry_run": dry_run,
-        },
-        "operations": operations,
-        "summary": {"files_scanned": len(operations)},
-    }
-    path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    manifest = copy.deepcopy(_MANIFEST_TEMPLATE)
+    manifest["config"]["mode"] = mode
+    manifest["config"]["dry_run"] = dry_run
+    manifest["operations"] = operations
+    manifest["summary"] = {"files_scanned": len(operations)}
+    # Compact dump: undo never needs a human-readable fixture.
+    path.write_text(json.dumps(manifest), encoding="utf-8")
     return path
 
 
+@pytest.fixture
+def undo_env(tmp_path):
+    """Undo test workspace: pre-made dirs plus a manifest-writing closure.
+
+    Function-scoped on purpose — undo tests delete and move the files the
+    fixture lays out, so a class-scoped workspace would leak state between
+    tests.
+    """
+    env = SimpleNamespace(
+        src=tmp_path / "source",
+        dest=tmp_path / "dest" / "2024" / "01",
+        discard=tmp_path / "discard",
+        logs=tmp_path / "logs",
+        manifest=tmp_path / "manifest.json",
+    )
+    env.src.mkdir()
+    env.dest.mkdir(parents=True)
+    env.discard.mkdir()
+    env.logs.mkdir()
+    env.write_manifest = (
+        lambda mode, operations, dry_run=False:
+        _write_manifest(env.manifest, mode, operations, dry_run)
+    )
+    return env
+
+
 class TestUndoCopyMode:
-    def test_deletes_copied_files(self, tmp_path):
+    def test_deletes_copied_files(self, undo_env):
         """Copy-mode undo should delete the copies from destination."""
-        src = tmp_path / "source"
-        src.mkdir()
-        dest = tmp_path / "dest" / "2024" / "01"
-        dest.mkdir(parents=True)
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-
         # Source still has the original
-        src_file = src / "photo.jpg"
+        src_file = undo_env.src / "photo.jpg"
         src_file.write_bytes(b"\xff\xd8" + b"\x00" * 50)
 
         # Copy exists in destination
-        dest_file = dest / "photo.jpg"
+        dest_file = undo_env.dest / "photo.jpg"
         dest_file.write_bytes(b"\xff\xd8" + b"\x00" * 50)
 
-        manifest_path = tmp_path / "manifest.json"
-        _write_manifest(manifest_path, "copy", [{
+        undo_env.write_manifest("copy", [{
             "action": "store",
             "source": str(src_file),
             "destination": str(dest_file),
@@ -56,27 +91,19 @@ class TestUndoCopyMode:
             "sidecars": [],
         }])
 
-        undo(manifest_path, dry_run=False, verbose=False, log_dir=log_dir)
+        undo(undo_env.manifest, dry_run=False, verbose=False, log_dir=undo_env.logs)
 
         assert not dest_file.exists()  # copy deleted
         assert src_file.exists()  # original untouched
 
-    def test_deletes_discarded_copies(self, tmp_path):
+    def test_deletes_discarded_copies(self, undo_env):
         """Copy-mode undo should delete files from discard dir too."""
-        src = tmp_path / "source"
-        src.mkdir()
-        discard = tmp_path / "discard"
-        discard.mkdir()
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-
-        src_file = src / "dup.jpg"
+        src_file = undo_env.src / "dup.jpg"
         src_file.write_bytes(b"\xff\xd8" + b"\x00" * 50)
-        discard_file = discard / "dup.jpg"
+        discard_file = undo_env.discard / "dup.jpg"
         discard_file.write_bytes(b"\xff\xd8" + b"\x00" * 50)
 
-        manifest_path = tmp_path / "manifest.json"
-        _write_manifest(manifest_path, "copy", [{
+        undo_env.write_manifest("copy", [{
             "action": "discard_source",
             "source": str(src_file),
             "destination": str(discard_file),
@@ -84,28 +111,20 @@ class TestUndoCopyMode:
             "sidecars": [],
         }])
 
-        undo(manifest_path, dry_run=False, verbose=False, log_dir=log_dir)
+        undo(undo_env.manifest, dry_run=False, verbose=False, log_dir=undo_env.logs)
 
         assert not discard_file.exists()
         assert src_file.exists()
 
 
 class TestUndoMoveMode:
-    def test_moves_files_back(self, tmp_path):
+    def test_moves_files_back(self, undo_env):
         """Move-mode undo should move files back to source."""
-        src_dir = tmp_path / "source"
-        src_dir.mkdir()
-        dest = tmp_path / "dest" / "2024" / "01"
-        dest.mkdir(parents=True)
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-
-        src_path = src_dir / "photo.jpg"
-        dest_file = dest / "photo.jpg"
+        src_path = undo_env.src / "photo.jpg"
+        dest_file = undo_env.dest / "photo.jpg"
         dest_file.write_bytes(b"\xff\xd8" + b"\x00" * 50)
 
-        manifest_path = tmp_path / "manifest.json"
-        _write_manifest(manifest_path, "move", [{
+        undo_env.write_manifest("move", [{
             "action": "store",
             "source": str(src_path),
             "destination": str(dest_file),
@@ -113,7 +132,7 @@ class TestUndoMoveMode:
             "sidecars": [],
         }])
 
-        undo(manifest_path, dry_run=False, verbose=False, log_dir=log_dir)
+        undo(undo_env.manifest, dry_run=False, verbose=False, log_dir=undo_env.logs)
 
         assert not dest_file.exists()
         assert src_path.exists()
@@ -121,18 +140,12 @@ class TestUndoMoveMode:
 
 
 class TestUndoDryRun:
-    def test_dry_run_no_changes(self, tmp_path):
+    def test_dry_run_no_changes(self, undo_env):
         """Dry-run undo should not modify any files."""
-        dest = tmp_path / "dest" / "2024" / "01"
-        dest.mkdir(parents=True)
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-
-        dest_file = dest / "photo.jpg"
+        dest_file = undo_env.dest / "photo.jpg"
         dest_file.write_bytes(b"\xff\xd8" + b"\x00" * 50)
 
-        manifest_path = tmp_path / "manifest.json"
-        _write_manifest(manifest_path, "copy", [{
+        undo_env.write_manifest("copy", [{
             "action": "store",
             "source": "/tmp/source/photo.jpg",
             "destination": str(dest_file),
@@ -140,46 +153,34 @@ class TestUndoDryRun:
             "sidecars": [],
         }])
 
-        undo(manifest_path, dry_run=True, verbose=False, log_dir=log_dir)
+        undo(undo_env.manifest, dry_run=True, verbose=False, log_dir=undo_env.logs)
 
         assert dest_file.exists()  # no changes in dry-run
 
 
 class TestUndoEdgeCases:
-    def test_already_gone_is_idempotent(self, tmp_path):
+    def test_already_gone_is_idempotent(self, undo_env):
         """If the file is already deleted, undo should not error."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-
-        manifest_path = tmp_path / "manifest.json"
-        _write_manifest(manifest_path, "copy", [{
+        undo_env.write_manifest("copy", [{
             "action": "store",
             "source": "/tmp/source/gone.jpg",
-            "destination": str(tmp_path / "nonexistent.jpg"),
+            "destination": str(undo_env.dest / "nonexistent.jpg"),
             "source_size": 100,
             "sidecars": [],
         }])
 
         # Should not raise
-        undo(manifest_path, dry_run=False, verbose=False, log_dir=log_dir)
+        undo(undo_env.manifest, dry_run=False, verbose=False, log_dir=undo_env.logs)
 
-    def test_empty_operations(self, tmp_path):
+    def test_empty_operations(self, undo_env):
         """Undo with no operations should succeed."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-
-        manifest_path = tmp_path / "manifest.json"
-        _write_manifest(manifest_path, "copy", [])
+        undo_env.write_manifest("copy", [])
 
-        undo(manifest_path, dry_run=False, verbose=False, log_dir=log_dir)
+        undo(undo_env.manifest, dry_run=False, verbose=False, log_dir=undo_env.logs)
 
-    def test_dry_run_original_skipped(self, tmp_path):
+    def test_dry_run_original_skipped(self, undo_env):
         """If the original run was dry-run, undo should do nothing."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-
-        manifest_path = tmp_path / "manifest.json"
-        _write_manifest(manifest_path, "copy", [{
+        undo_env.write_manifest("copy", [{
             "action": "store",
             "source": "/tmp/source/photo.jpg",
             "destination": "/tmp/dest/photo.jpg",
@@ -187,29 +188,21 @@ class TestUndoEdgeCases:
             "sidecars": [],
         }], dry_run=True)
 
-        undo(manifest_path, dry_run=False, verbose=False, log_dir=log_dir)
+        undo(undo_env.manifest, dry_run=False, verbose=False, log_dir=undo_env.logs)
 
-    def test_undo_with_sidecars(self, tmp_path):
+    def test_undo_with_sidecars(self, undo_env):
         """Undo should also remove sidecar files."""
-        src = tmp_path / "source"
-        src.mkdir()
-        dest = tmp_path / "dest" / "2024" / "01"
-        dest.mkdir(parents=True)
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-
-        src_file = src / "photo.jpg"
+        src_file = undo_env.src / "photo.jpg"
         src_file.write_bytes(b"\xff\xd8" + b"\x00" * 50)
-        src_xmp = src / "photo.xmp"
+        src_xmp = undo_env.src / "photo.xmp"
         src_xmp.write_text("<xmp/>")
 
-        dest_file = dest / "photo.jpg"
+        dest_file = undo_env.dest / "photo.jpg"
         dest_file.write_bytes(b"\xff\xd8" + b"\x00" * 50)
-        dest_xmp = dest / "photo.xmp"
+        dest_xmp = undo_env.dest / "photo.xmp"
         dest_xmp.write_text("<xmp/>")
 
-        manifest_path = tmp_path / "manifest.json"
-        _write_manifest(manifest_path, "copy", [{
+        undo_env.write_manifest("copy", [{
             "action": "store",
             "source": str(src_file),
             "destination": str(dest_file),
@@ -220,28 +213,52 @@ class TestUndoEdgeCases:
             }],
         }])
 
-        undo(manifest_path, dry_run=False, verbose=False, log_dir=log_dir)
+        undo(undo_env.manifest, dry_run=False, verbose=False, log_dir=undo_env.logs)
 
         assert not dest_file.exists()
         assert not dest_xmp.exists()
 
-    def test_writes_undo_manifest(self, tmp_path):
-        """Undo should write its own JSON manifest."""
-        src = tmp_path / "source"
-        src.mkdir()
-        dest = tmp_path / "dest"
-        dest.mkdir()
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
+    def test_unreadable_destination_counts_as_error(self, undo_env, monkeypatch):
+        """A stat failure other than ENOENT is an error, not a crash.
+
+        The run must still finish, write the undo manifest, and exit 1.
+        """
+        dest_file = undo_env.dest / "photo.jpg"
+        dest_file.write_bytes(b"\xff\xd8" + b"\x00" * 50)
 
+        undo_env.write_manifest("copy", [{
+            "action": "store",
+            "source": "/tmp/source/photo.jpg",
+            "destination": str(dest_file),
+            "source_size": 52,
+            "sidecars": [],
+        }])
+
+        real_stat = Path.stat
+
+        def broken_stat(self, *args, **kwargs):
+            if self.name == "photo.jpg":
+                raise PermissionError(13, "Permission denied")
+            return real_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "stat", broken_stat)
+
+        with pytest.raises(SystemExit) as exc:
+            undo(undo_env.manifest, dry_run=False, verbose=False,
+                 log_dir=undo_env.logs)
+
+        assert exc.value.code == 1
+        assert len(_glob_scandir(undo_env.logs, "_undo.json")) == 1
+
+    def test_writes_undo_manifest(self, undo_env):
+        """Undo should write its own JSON manifest."""
         # Need at least one operation so undo doesn't short-circuit
-        src_file = src / "photo.jpg"
+        src_file = undo_env.src / "photo.jpg"
         src_file.write_bytes(b"\xff\xd8" + b"\x00" * 50)
-        dest_file = dest / "photo.jpg"
+        dest_file = undo_env.dest / "photo.jpg"
         dest_file.write_bytes(b"\xff\xd8" + b"\x00" * 50)
 
-        manifest_path = tmp_path / "manifest.json"
-        _write_manifest(manifest_path, "copy", [{
+        undo_env.write_manifest("copy", [{
             "action": "store",
             "source": str(src_file),
             "destination": str(dest_file),
@@ -249,9 +266,9 @@ class TestUndoEdgeCases:
             "sidecars": [],
         }])
 
-        undo(manifest_path, dry_run=False, verbose=False, log_dir=log_dir)
+        undo(undo_env.manifest, dry_run=False, verbose=False, log_dir=undo_env.logs)
 
-        undo_manifests = list(log_dir.glob("*_undo.json"))
+        undo_manifests = _glob_scandir(undo_env.logs, "_undo.json")
         assert len(undo_manifests) == 1
 
         data = json.loads(undo_manifests[0].read_text())
@@ -276,6 +293,18 @@ class TestLoadManifest:
         with pytest.raises(SystemExit, match="schema_version"):
             _load_manifest(f)
 
+    def test_reads_gzip_manifest(self, tmp_path):
+        """Compressed manifests load transparently (detected by magic bytes)."""
+        f = tmp_path / "run.json.gz"
+        manifest = {
+            "schema_version": "1.0",
+            "operations": [],
+            "config": {"mode": "copy"},
+        }
+        with gzip.open(f, "wt", encoding="utf-8") as gz:
+            json.dump(manifest, gz)
+        assert _load_manifest(f)["config"]["mode"] == "copy"
+
     def test_missing_operations(self, tmp_path):
         f = tmp_path / "no_ops.json"
         f.write_text(json.dumps({"schema_version": "1.0", "config": {"mode": "copy"}}))